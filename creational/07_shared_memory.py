@@ -0,0 +1,280 @@
+import random
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+class Rectangle:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rotation_count = 0
+
+    def area(self):
+        return self.width * self.height
+
+    def rotate(self):
+        self.width, self.height = self.height, self.width
+        self.rotation_count += 1
+
+    def __str__(self):
+        lines = []
+        for i in range(self.height):
+            if i == 0 or i == self.height - 1:
+                lines.append(
+                    "+" + "-" * max(0, self.width - 2) + ("+" if self.width > 1 else "")
+                )
+            else:
+                lines.append(
+                    "|" + " " * max(0, self.width - 2) + ("|" if self.width > 1 else "")
+                )
+        return "\n".join(lines)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+class FilledRectangle(Rectangle):
+    def __init__(self, width, height, fill_char=""):
+        super().__init__(width, height)
+        self.fill_char = fill_char
+
+    def __str__(self):
+        return "\n".join([self.fill_char * self.width] * self.height)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height, self.fill_char)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+
+class AbstractRectangleFactory(ABC):
+    @abstractmethod
+    def create(self, width, height) -> Rectangle:
+        pass
+
+
+class RectangleFactory(AbstractRectangleFactory):
+    def create(self, width, height):
+        return Rectangle(width, height)
+
+
+class FilledRectangleFactory(AbstractRectangleFactory):
+    def __init__(self, fill_char):
+        self.fill_char = fill_char
+
+    def create(self, width, height):
+        return FilledRectangle(width, height, self.fill_char)
+
+
+class RectangleContainer:
+    def __init__(self, rectangles: list[Rectangle]) -> None:
+        self.rectangles = rectangles
+
+    def to_landscape(self):
+        for rectangle in self.rectangles:
+            if rectangle.height > rectangle.width:
+                rectangle.rotate()
+
+    def to_portrait(self):
+        for rectangle in self.rectangles:
+            if rectangle.width > rectangle.height:
+                rectangle.rotate()
+
+
+# New class: stores the rectangles in a shared memory block instead of a list
+# Problem: sending a RectangleContainer to worker processes pickles every Rectangle,
+# so each worker gets its own copy and the results must be pickled back again.
+# Solution: keep the data in typed arrays, which every process can attach by name.
+# The objects are only rebuilt when they are needed, e.g. for printing.
+class SharedRectangleContainer:
+    # The stored type is the index of the class in this tuple
+    TYPES = (Rectangle, FilledRectangle)
+    # Columns of the table, fill_char is stored as a code point (0 if empty),
+    # so only single-character fills are supported
+    FIELDS = ("width", "height", "rotation_count", "type", "fill_char")
+    ITEM_SIZE = 8  # every value is a signed 64-bit integer ("q")
+
+    def __init__(self, count, name=None, create=True) -> None:
+        if create:
+            # The first value of the block is the number of rectangles
+            size = (1 + len(self.FIELDS) * max(1, count)) * self.ITEM_SIZE
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._values = self.shm.buf.cast("q")
+            self._values[0] = count
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self._values = self.shm.buf.cast("q")
+            count = self._values[0]
+        self.count = count
+        # One memoryview per column, they all point into the same shared block
+        for i, field in enumerate(self.FIELDS):
+            start = 1 + i * count
+            setattr(self, field, self._values[start : start + count])
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    # Alternative constructor: copy the rectangles of a container into shared memory
+    @classmethod
+    def from_container(cls, container: RectangleContainer, name=None):
+        shared = cls(len(container.rectangles), name=name)
+        try:
+            for i, rectangle in enumerate(container.rectangles):
+                shared.width[i] = rectangle.width
+                shared.height[i] = rectangle.height
+                shared.rotation_count[i] = rectangle.rotation_count
+                shared.type[i] = cls.TYPES.index(type(rectangle))
+                fill_char = getattr(rectangle, "fill_char", "")
+                if len(fill_char) > 1:
+                    raise ValueError(
+                        f"fill_char must be a single character, got {fill_char!r}"
+                    )
+                shared.fill_char[i] = ord(fill_char) if fill_char else 0
+        except Exception:
+            # Nobody else knows the name yet, so the block must be freed here
+            shared.close()
+            shared.unlink()
+            raise
+        return shared
+
+    # Alternative constructor: attach to a block created by another process
+    @classmethod
+    def attach(cls, name):
+        return cls(0, name=name, create=False)
+
+    def __len__(self):
+        return self.count
+
+    def _range(self, start, stop):
+        return range(*slice(start, stop).indices(self.count))
+
+    # Note: workers should get disjoint index ranges, there is no locking
+    def rotate(self, index):
+        self.width[index], self.height[index] = self.height[index], self.width[index]
+        self.rotation_count[index] += 1
+
+    def to_landscape(self, start=0, stop=None):
+        for i in self._range(start, stop):
+            if self.height[i] > self.width[i]:
+                self.rotate(i)
+
+    def to_portrait(self, start=0, stop=None):
+        for i in self._range(start, stop):
+            if self.width[i] > self.height[i]:
+                self.rotate(i)
+
+    def total_area(self, start=0, stop=None):
+        return sum(self.width[i] * self.height[i] for i in self._range(start, stop))
+
+    # Rebuild a Rectangle object from one row of the table
+    def get(self, index) -> Rectangle:
+        rectangle_type = self.TYPES[self.type[index]]
+        if rectangle_type is FilledRectangle:
+            code = self.fill_char[index]
+            rectangle = FilledRectangle(
+                self.width[index], self.height[index], chr(code) if code else ""
+            )
+        else:
+            rectangle = rectangle_type(self.width[index], self.height[index])
+        rectangle.rotation_count = self.rotation_count[index]
+        return rectangle
+
+    def to_container(self) -> RectangleContainer:
+        return RectangleContainer([self.get(i) for i in range(self.count)])
+
+    # The memoryviews must be released before the shared memory can be closed
+    def close(self):
+        for field in self.FIELDS:
+            getattr(self, field).release()
+        self._values.release()
+        self.shm.close()
+
+    # Only the creator should call unlink, after every process has closed the block
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RectangleGenerator:
+    def __init__(
+        self,
+        min_width=2,
+        max_width=6,
+        min_height=2,
+        max_height=6,
+        rectangle_factory=RectangleFactory(),
+    ) -> None:
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.rectangle_factory = rectangle_factory
+
+    def generate_rectangles(self, count):
+        rectangles = list[Rectangle]()
+        for _ in range(count):
+            width = random.randint(self.min_width, self.max_width)
+            height = random.randint(self.min_height, self.max_height)
+            rectangles.append(self.rectangle_factory.create(width, height))
+        return rectangles
+
+
+def print_rectangles(container: RectangleContainer):
+    for rectangle in container.rectangles:
+        print(rectangle)
+        print(f"Area: {rectangle.width}x{rectangle.height} = {rectangle.area()}")
+        print(f"Rotations: {rectangle.rotation_count}")
+        print()
+
+
+# New: runs in a worker process, only the name and the index range are pickled
+def landscape_worker(name, start, stop):
+    with SharedRectangleContainer.attach(name) as shared:
+        shared.to_landscape(start, stop)
+        return shared.total_area(start, stop)
+
+
+def main():
+    gen = RectangleGenerator()
+    fgen = RectangleGenerator(rectangle_factory=FilledRectangleFactory("#"))
+    rectangles = RectangleContainer(
+        gen.generate_rectangles(2) + fgen.generate_rectangles(2)
+    )
+    print_rectangles(rectangles)
+    shared = SharedRectangleContainer.from_container(rectangles)
+    try:
+        workers = 2
+        chunk = (len(shared) + workers - 1) // workers
+        ranges = [(i, i + chunk) for i in range(0, len(shared), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(landscape_worker, shared.name, start, stop)
+                for start, stop in ranges
+            ]
+            total_area = sum(future.result() for future in futures)
+        # The workers modified the shared block in place, no results were copied
+        landscape = shared.to_container()
+        print("Landscape:")
+        print_rectangles(landscape)
+        print("Total area:", total_area)
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import math
+import random
+from abc import ABC, abstractmethod
+
+
+class Rectangle:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rotation_count = 0
+
+    def area(self):
+        return self.width * self.height
+
+    def rotate(self):
+        self.width, self.height = self.height, self.width
+        self.rotation_count += 1
+
+    def __str__(self):
+        lines = []
+        for i in range(self.height):
+            if i == 0 or i == self.height - 1:
+                lines.append(
+                    "+" + "-" * max(0, self.width - 2) + ("+" if self.width > 1 else "")
+                )
+            else:
+                lines.append(
+                    "|" + " " * max(0, self.width - 2) + ("|" if self.width > 1 else "")
+                )
+        return "\n".join(lines)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+class FilledRectangle(Rectangle):
+    def __init__(self, width, height, fill_char=""):
+        super().__init__(width, height)
+        self.fill_char = fill_char
+
+    def __str__(self):
+        return "\n".join([self.fill_char * self.width] * self.height)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height, self.fill_char)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+
+# New class: filled with a repeated pattern instead of a single character
+# The pattern is a list of rows, e.g.:
+# stripes:      ["-="]
+# checkerboard: ["#.", ".#"]
+# A single string is treated as a pattern with one row.
+class PatternedRectangle(Rectangle):
+    def __init__(self, width, height, pattern=" "):
+        super().__init__(width, height)
+        if isinstance(pattern, str):
+            pattern = [pattern]
+        self.pattern = list(pattern)
+        if not self.pattern or not all(self.pattern):
+            raise ValueError("pattern must contain at least one non-empty row")
+
+    def __str__(self):
+        # Building the output character by character would be much slower than
+        # fill_char * width in FilledRectangle.
+        # Instead, each pattern row is widened once by string repetition ...
+        rows = [
+            (row * (self.width // len(row) + 1))[: self.width] for row in self.pattern
+        ]
+        # ... and the finished rows are cycled by repeating the list
+        period = len(rows)
+        lines = (rows * (self.height // period + 1))[: self.height]
+        return "\n".join(lines)
+
+    def rotate(self):
+        # The pattern must be rotated together with the rectangle.
+        # First the rows are repeated to the same length, so the tile is a grid ...
+        period = math.lcm(*(len(row) for row in self.pattern))
+        rows = [row * (period // len(row)) for row in self.pattern]
+        # ... then it is transposed, like the width and height in Rectangle.rotate
+        self.pattern = ["".join(column) for column in zip(*rows)]
+        super().rotate()
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height, self.pattern)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+    def __deepcopy__(self, memo):
+        # The pattern list is mutable, so the copy gets its own list
+        new_instance = self.__copy__()
+        new_instance.pattern = list(self.pattern)
+        return new_instance
+
+
+class AbstractRectangleFactory(ABC):
+    @abstractmethod
+    def create(self, width, height) -> Rectangle:
+        pass
+
+
+class RectangleFactory(AbstractRectangleFactory):
+    def create(self, width, height):
+        return Rectangle(width, height)
+
+
+class FilledRectangleFactory(AbstractRectangleFactory):
+    def __init__(self, fill_char):
+        self.fill_char = fill_char
+
+    def create(self, width, height):
+        return FilledRectangle(width, height, self.fill_char)
+
+
+# New: Concrete factory for PatternedRectangle objects
+# Thanks to the abstract factory, RectangleGenerator does not need to change
+class PatternedRectangleFactory(AbstractRectangleFactory):
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def create(self, width, height):
+        return PatternedRectangle(width, height, self.pattern)
+
+
+class RectangleContainer:
+    def __init__(self, rectangles: list[Rectangle]) -> None:
+        self.rectangles = rectangles
+
+    def to_landscape(self):
+        for rectangle in self.rectangles:
+            if rectangle.height > rectangle.width:
+                rectangle.rotate()
+
+    def to_portrait(self):
+        for rectangle in self.rectangles:
+            if rectangle.width > rectangle.height:
+                rectangle.rotate()
+
+
+class RectangleGenerator:
+    def __init__(
+        self,
+        min_width=2,
+        max_width=6,
+        min_height=2,
+        max_height=6,
+        rectangle_factory=RectangleFactory(),
+    ) -> None:
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.rectangle_factory = rectangle_factory
+
+    def generate_rectangles(self, count):
+        rectangles = list[Rectangle]()
+        for _ in range(count):
+            width = random.randint(self.min_width, self.max_width)
+            height = random.randint(self.min_height, self.max_height)
+            rectangles.append(self.rectangle_factory.create(width, height))
+        return rectangles
+
+
+def print_rectangles(container: RectangleContainer):
+    for rectangle in container.rectangles:
+        print(rectangle)
+        print(f"Area: {rectangle.width}x{rectangle.height} = {rectangle.area()}")
+        print(f"Rotations: {rectangle.rotation_count}")
+        print()
+
+
+def main():
+    stripes = RectangleGenerator(
+        min_width=4, max_width=10, rectangle_factory=PatternedRectangleFactory("-=")
+    )
+    checkerboard = RectangleGenerator(
+        min_width=4,
+        max_width=10,
+        rectangle_factory=PatternedRectangleFactory(["#.", ".#"]),
+    )
+    motif = RectangleGenerator(
+        min_width=6,
+        max_width=12,
+        min_height=3,
+        rectangle_factory=PatternedRectangleFactory(["/\\", "\\/"]),
+    )
+    rectangles = RectangleContainer(
+        stripes.generate_rectangles(1)
+        + checkerboard.generate_rectangles(1)
+        + motif.generate_rectangles(1)
+    )
+    print_rectangles(rectangles)
+    from copy import deepcopy
+
+    landscape = deepcopy(rectangles)
+    landscape.to_landscape()
+    print("Landscape:")
+    print_rectangles(landscape)
+    # The rotated pattern is the transposed picture of the original one
+    for original, rotated in zip(rectangles.rectangles, landscape.rectangles):
+        if rotated.rotation_count:
+            columns = zip(*str(original).split("\n"))
+            assert str(rotated).split("\n") == ["".join(column) for column in columns]
+    stripe = PatternedRectangle(4, 2, "-=")
+    stripe.rotate()
+    assert str(stripe) == "--\n==\n--\n=="
+
+
+if __name__ == "__main__":
+    main()
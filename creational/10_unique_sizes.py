@@ -0,0 +1,273 @@
+import math
+import random
+from abc import ABC, abstractmethod
+
+
+class Rectangle:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rotation_count = 0
+
+    def area(self):
+        return self.width * self.height
+
+    def rotate(self):
+        self.width, self.height = self.height, self.width
+        self.rotation_count += 1
+
+    def __str__(self):
+        lines = []
+        for i in range(self.height):
+            if i == 0 or i == self.height - 1:
+                lines.append(
+                    "+" + "-" * max(0, self.width - 2) + ("+" if self.width > 1 else "")
+                )
+            else:
+                lines.append(
+                    "|" + " " * max(0, self.width - 2) + ("|" if self.width > 1 else "")
+                )
+        return "\n".join(lines)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+class FilledRectangle(Rectangle):
+    def __init__(self, width, height, fill_char=""):
+        super().__init__(width, height)
+        self.fill_char = fill_char
+
+    def __str__(self):
+        return "\n".join([self.fill_char * self.width] * self.height)
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height, self.fill_char)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+
+class PatternedRectangle(Rectangle):
+    def __init__(self, width, height, pattern=" "):
+        super().__init__(width, height)
+        if isinstance(pattern, str):
+            pattern = [pattern]
+        self.pattern = list(pattern)
+        if not self.pattern or not all(self.pattern):
+            raise ValueError("pattern must contain at least one non-empty row")
+
+    def __str__(self):
+        rows = [
+            (row * (self.width // len(row) + 1))[: self.width] for row in self.pattern
+        ]
+        period = len(rows)
+        lines = (rows * (self.height // period + 1))[: self.height]
+        return "\n".join(lines)
+
+    def rotate(self):
+        period = math.lcm(*(len(row) for row in self.pattern))
+        rows = [row * (period // len(row)) for row in self.pattern]
+        self.pattern = ["".join(column) for column in zip(*rows)]
+        super().rotate()
+
+    def __copy__(self):
+        new_instance = self.__class__(self.width, self.height, self.pattern)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.rotation_count = 0
+        return new_instance
+
+    def __deepcopy__(self, memo):
+        new_instance = self.__copy__()
+        new_instance.pattern = list(self.pattern)
+        return new_instance
+
+
+class AbstractRectangleFactory(ABC):
+    @abstractmethod
+    def create(self, width, height) -> Rectangle:
+        pass
+
+
+class RectangleFactory(AbstractRectangleFactory):
+    def create(self, width, height):
+        return Rectangle(width, height)
+
+
+class FilledRectangleFactory(AbstractRectangleFactory):
+    def __init__(self, fill_char):
+        self.fill_char = fill_char
+
+    def create(self, width, height):
+        return FilledRectangle(width, height, self.fill_char)
+
+
+class PatternedRectangleFactory(AbstractRectangleFactory):
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def create(self, width, height):
+        return PatternedRectangle(width, height, self.pattern)
+
+
+class WeightedRectangleFactory(AbstractRectangleFactory):
+    def __init__(
+        self, weighted_factories: list[tuple[AbstractRectangleFactory, float]]
+    ) -> None:
+        if not weighted_factories:
+            raise ValueError("At least one factory is required")
+        self.factories = [factory for factory, _ in weighted_factories]
+        weights = [weight for _, weight in weighted_factories]
+        total = sum(weights)
+        if not all(math.isfinite(w) and w >= 0 for w in weights) or total <= 0:
+            raise ValueError(
+                "Weights must be finite, non-negative and have a positive sum"
+            )
+        # Alias method (Vose): the tables are built once in O(n), then every pick
+        # costs one random index and one coin flip, regardless of the number of
+        # factories
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            # The large column donates the missing part of the small column
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Leftover columns (if any, due to rounding errors) are always kept: p = 1.0
+
+    def choose(self) -> AbstractRectangleFactory:
+        i = random.randrange(len(self.factories))
+        if random.random() < self.probability[i]:
+            return self.factories[i]
+        return self.factories[self.alias[i]]
+
+    def create(self, width, height):
+        return self.choose().create(width, height)
+
+
+class RectangleContainer:
+    def __init__(self, rectangles: list[Rectangle]) -> None:
+        self.rectangles = rectangles
+
+    def to_landscape(self):
+        for rectangle in self.rectangles:
+            if rectangle.height > rectangle.width:
+                rectangle.rotate()
+
+    def to_portrait(self):
+        for rectangle in self.rectangles:
+            if rectangle.width > rectangle.height:
+                rectangle.rotate()
+
+
+class RectangleGenerator:
+    def __init__(
+        self,
+        min_width=2,
+        max_width=6,
+        min_height=2,
+        max_height=6,
+        rectangle_factory=RectangleFactory(),
+    ) -> None:
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.rectangle_factory = rectangle_factory
+
+    def generate_rectangles(self, count, group_by_type=False):
+        rectangles = list[Rectangle]()
+        groups = dict[type, list[Rectangle]]()
+        for _ in range(count):
+            width = random.randint(self.min_width, self.max_width)
+            height = random.randint(self.min_height, self.max_height)
+            rectangle = self.rectangle_factory.create(width, height)
+            if group_by_type:
+                groups.setdefault(type(rectangle), []).append(rectangle)
+            else:
+                rectangles.append(rectangle)
+        # Groups are ordered by the first occurrence of each type
+        for group in groups.values():
+            rectangles.extend(group)
+        return rectangles
+
+    # New method: every rectangle gets a different (width, height) pair
+    # Problem: repeating generate_rectangles until the sizes are distinct gets very
+    # slow, when count is close to the number of possible sizes.
+    # Solution: number the possible sizes, and sample the numbers without
+    # replacement. random.sample accepts a range, which is not expanded into a list,
+    # so this costs O(count) time and memory.
+    def generate_unique(self, count, seed=None):
+        rng = random.Random(seed)
+        widths = self.max_width - self.min_width + 1
+        heights = self.max_height - self.min_height + 1
+        if widths <= 0 or heights <= 0:
+            raise ValueError("The minimum sizes must not exceed the maximum sizes")
+        if count > widths * heights:
+            raise ValueError(f"Only {widths * heights} distinct sizes are possible")
+        rectangles = list[Rectangle]()
+        for index in rng.sample(range(widths * heights), count):
+            width = self.min_width + index // heights
+            height = self.min_height + index % heights
+            rectangles.append(self.rectangle_factory.create(width, height))
+        return rectangles
+
+    # New method: the same for squares, where only the size has to be distinct
+    def generate_unique_squares(self, count, seed=None):
+        rng = random.Random(seed)
+        minsize = max(self.min_width, self.min_height)
+        maxsize = min(self.max_width, self.max_height)
+        sizes = range(minsize, maxsize + 1)
+        if not sizes:
+            raise ValueError("There is no square size within the bounds")
+        if count > len(sizes):
+            raise ValueError(f"Only {len(sizes)} distinct square sizes are possible")
+        squares = list[Rectangle]()
+        for size in rng.sample(sizes, count):
+            squares.append(self.rectangle_factory.create(size, size))
+        return squares
+
+
+def print_rectangles(container: RectangleContainer):
+    for rectangle in container.rectangles:
+        print(rectangle)
+        print(f"Area: {rectangle.width}x{rectangle.height} = {rectangle.area()}")
+        print(f"Rotations: {rectangle.rotation_count}")
+        print()
+
+
+def main():
+    gen = RectangleGenerator()
+    # There are 5x5 possible sizes, all of them are used exactly once
+    rectangles = RectangleContainer(gen.generate_unique(25, seed=42))
+    sizes = {(r.width, r.height) for r in rectangles.rectangles}
+    assert len(sizes) == 25
+    # The same seed gives the same rectangles
+    again = RectangleContainer(gen.generate_unique(25, seed=42))
+    assert [(r.width, r.height) for r in again.rectangles] == [
+        (r.width, r.height) for r in rectangles.rectangles
+    ]
+    print_rectangles(RectangleContainer(rectangles.rectangles[:3]))
+    fgen = RectangleGenerator(rectangle_factory=FilledRectangleFactory("#"))
+    squares = RectangleContainer(fgen.generate_unique_squares(3))
+    print("Squares:")
+    print_rectangles(squares)
+
+
+if __name__ == "__main__":
+    main()